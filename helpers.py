@@ -10,6 +10,10 @@ import ctypes
 from pathlib import Path
 from typing import Optional
 
+# Project paths never change within a process, so resolve them once
+_PROJECT_DIR = Path(__file__).resolve().parent
+_UI_DIR = _PROJECT_DIR / "ui"
+
 def has_console():
     """Check whether the process has a console window attached."""
     try:
@@ -30,8 +34,11 @@ def validate_xml_file(file_path: str) -> bool:
     if not file_path:
         return False
     
-    path = Path(file_path)
-    return path.exists() and path.suffix.lower() == '.xml'
+    # Check the extension first so rejected paths never touch the file system
+    if not file_path.lower().endswith('.xml'):
+        return False
+    
+    return os.path.isfile(file_path)
 
 
 def validate_srt_path(file_path: str) -> bool:
@@ -47,15 +54,13 @@ def validate_srt_path(file_path: str) -> bool:
     if not file_path:
         return False
     
-    path = Path(file_path)
-    
-    # Check if directory exists (or can be created)
-    parent_dir = path.parent
-    if not parent_dir.exists():
+    # Ensure .srt extension
+    if not file_path.lower().endswith('.srt'):
         return False
     
-    # Ensure .srt extension
-    return path.suffix.lower() == '.srt'
+    # Check if directory exists
+    parent_dir = os.path.dirname(file_path) or os.curdir
+    return os.path.isdir(parent_dir)
 
 
 def ensure_srt_extension(file_path: str) -> str:
@@ -68,6 +73,10 @@ def ensure_srt_extension(file_path: str) -> str:
     Returns:
         File path with .srt extension
     """
+    # Fast path: most paths already carry the extension
+    if file_path.endswith(('.srt', '.SRT')):
+        return file_path
+    
     path = Path(file_path)
     if path.suffix.lower() != '.srt':
         return str(path.with_suffix('.srt'))
@@ -107,7 +116,7 @@ def get_project_directory() -> Path:
     Returns:
         Path to the project root directory
     """
-    return Path(__file__).resolve().parent
+    return _PROJECT_DIR
 
 
 def get_ui_directory() -> Path:
@@ -117,4 +126,4 @@ def get_ui_directory() -> Path:
     Returns:
         Path to the UI directory
     """
-    return get_project_directory() / "ui"
+    return _UI_DIR
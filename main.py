@@ -1,6 +1,4 @@
 import sys
-from PyQt6.QtWidgets import QApplication
-from modules import MainWindow
 from modules import Console
 from modules import Parameters
 import helpers
@@ -10,6 +8,10 @@ def main():
 
     # Check if the console is attached
     if not helpers.has_console() or params.get_param_value('gui'):
+        # Import the GUI only when needed so console runs skip loading PyQt6
+        from PyQt6.QtWidgets import QApplication
+        from modules import MainWindow
+
         app = QApplication([])
         window = MainWindow()
         window.show()
@@ -20,4 +22,4 @@ def main():
         app.run(params=params)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,13 +2,24 @@
 GoSubtitle modules package.
 
 Exports:
-    MainWindow: The main application window
+    MainWindow: The main application window (imported lazily, as it needs PyQt6)
+    Console: Command-line interface
+    Parameters: Command-line parameter parser
     SubtitleProcessor: Business logic for subtitle processing
+    Subtitle: A single subtitle entry
 """
 
-from .window import MainWindow
 from .console import Console
 from .parameters import Parameters
-from .subtitle_processor import SubtitleProcessor
+from .subtitle_processor import SubtitleProcessor, Subtitle
 
-__all__ = ['MainWindow', 'SubtitleProcessor', 'Console', 'Parameters']
+__all__ = ['MainWindow', 'SubtitleProcessor', 'Subtitle', 'Console', 'Parameters']
+
+
+def __getattr__(name: str):
+    """Import MainWindow on first access so console-only runs skip PyQt6."""
+    if name == 'MainWindow':
+        from .window import MainWindow
+        globals()['MainWindow'] = MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
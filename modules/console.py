@@ -6,17 +6,14 @@ without the GUI, supporting batch operations and automated workflows.
 """
 
 import logging
-from typing import List, Dict, Optional
+from collections import Counter
+from itertools import islice
+from typing import List, Dict
 from pathlib import Path
 
-from .subtitle_processor import SubtitleProcessor
+from .subtitle_processor import SubtitleProcessor, Subtitle
 from .parameters import Parameters
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -28,10 +25,13 @@ class Console:
     transformations, and exporting to SRT format.
     """
     
+    # Configuration constants
+    WRITE_CHUNK_ENTRIES = 8192  # Subtitles joined per write call
+    
     def __init__(self):
         """Initialize the console interface."""
         self.processor = SubtitleProcessor()
-        self.subtitles: List[Dict[str, any]] = []
+        self.subtitles: List[Subtitle] = []
         
     def run(self, params: Parameters) -> None:
         """
@@ -40,6 +40,12 @@ class Console:
         Args:
             params: Parsed command-line parameters
         """
+        # Configure logging for console mode (no-op if already configured)
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s'
+        )
+        
         # Get input file path
         input_file = params.get_param_value('file')
         if not input_file:
@@ -68,6 +74,12 @@ class Console:
         
         output_path = Path(output_file)
         
+        # Apply max words per line if specified, before splitting happens
+        max_words = params.get_param_value('max_words')
+        if max_words and max_words != self.processor.max_words_per_line:
+            print(f"Using max {max_words} words per line...")
+            self.processor.max_words_per_line = max_words
+        
         # Parse XML file
         print(f"Loading subtitles from: {input_file}")
         try:
@@ -103,20 +115,6 @@ class Console:
         if replace_text_map:
             print("Applying text replacements...")
             self.apply_text_replacements(replace_text_map)
-
-        # Apply max words per line if specified
-        max_words = params.get_param_value('max_words')
-        if max_words and max_words != self.processor.max_words_per_line:
-            print(f"Re-processing with max {max_words} words per line...")
-            self.processor.max_words_per_line = max_words
-            # Re-parse to apply new word limit
-            self.subtitles = self.processor.parse_xml(str(input_path))
-            if offset is not None and offset != 0:
-                SubtitleProcessor.apply_offset(self.subtitles, offset)
-            if replace_map:
-                self.apply_speaker_replacements(replace_map)
-            if replace_text_map:
-                self.apply_text_replacements(replace_text_map)
         
         # Display subtitle statistics
         if params.get_param_value('verbose'):
@@ -141,18 +139,23 @@ class Console:
         Args:
             replace_map: Dictionary mapping old speaker names to new names
         """
-        replacement_count = {}
+        # Speakers are stored capitalized, so also accept names as they appear
+        # in the XML (e.g. "narrator"); exact matches take precedence
+        normalized = {old.capitalize(): new for old, new in replace_map.items()}
+        normalized.update(replace_map)
+        
+        replacement_count = Counter()
         
         for subtitle in self.subtitles:
-            old_speaker = subtitle['speaker']
-            if old_speaker in replace_map:
-                new_speaker = replace_map[old_speaker]
-                subtitle['speaker'] = new_speaker
-                replacement_count[old_speaker] = replacement_count.get(old_speaker, 0) + 1
+            old_speaker = subtitle.speaker
+            new_speaker = normalized.get(old_speaker)
+            if new_speaker is not None:
+                subtitle.speaker = new_speaker
+                replacement_count[old_speaker] += 1
         
         # Log replacements
         for old_name, count in replacement_count.items():
-            new_name = replace_map[old_name]
+            new_name = normalized[old_name]
             print(f"  Replaced '{old_name}' with '{new_name}' ({count} occurrence(s))")
             logger.info(f"Replaced speaker '{old_name}' with '{new_name}' ({count} occurrences)")
 
@@ -172,8 +175,8 @@ class Console:
 
         for subtitle in self.subtitles:
             for old_text, new_text in replace_map.items():
-                if old_text in subtitle['text']:
-                    subtitle['text'] = subtitle['text'].replace(old_text, new_text)
+                if old_text in subtitle.text:
+                    subtitle.text = subtitle.text.replace(old_text, new_text)
                     replacement_count[old_text] = replacement_count.get(old_text, 0) + 1
 
         # Log replacements
@@ -187,14 +190,9 @@ class Console:
         if not self.subtitles:
             return
         
-        # Count speakers
-        speaker_counts = {}
-        total_duration = 0.0
-        
-        for subtitle in self.subtitles:
-            speaker = subtitle['speaker']
-            speaker_counts[speaker] = speaker_counts.get(speaker, 0) + 1
-            total_duration += (subtitle['stop'] - subtitle['start'])
+        # Count speakers and sum durations
+        speaker_counts = Counter(subtitle.speaker for subtitle in self.subtitles)
+        total_duration = sum(subtitle.stop - subtitle.start for subtitle in self.subtitles)
         
         # Convert total duration to time format
         duration_str = SubtitleProcessor.format_time(total_duration)
@@ -218,12 +216,12 @@ class Console:
         Raises:
             IOError: If the file cannot be written
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for idx, subtitle in enumerate(self.subtitles, start=1):
-                start_time = SubtitleProcessor.format_time(subtitle['start'])
-                end_time = SubtitleProcessor.format_time(subtitle['stop'])
-                
-                f.write(f"{idx}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{subtitle['speaker']}: {subtitle['text']}\n\n")
-        pass
\ No newline at end of file
+        entries = SubtitleProcessor.srt_entries(self.subtitles)
+        
+        with open(output_path, 'w', encoding='utf-8', buffering=SubtitleProcessor.WRITE_BUFFER_SIZE) as f:
+            # Write in chunks to bound memory on very large files
+            while True:
+                chunk = ''.join(islice(entries, self.WRITE_CHUNK_ENTRIES))
+                if not chunk:
+                    break
+                f.write(chunk)
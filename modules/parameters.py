@@ -5,9 +5,102 @@ Handles command-line argument parsing and parameter management.
 """
 
 import argparse
+import functools
 from typing import Dict, Optional
 
 
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser with all available options.
+    
+    The parser is built once and reused by every Parameters instance.
+    
+    Returns:
+        Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="GoSubtitle - Convert Movie XML files to SRT subtitles",
+        epilog="Examples:\n"
+               "  GoSubtitle.exe -f movie.xml\n"
+               "  GoSubtitle.exe -f movie.xml -s subtitles.srt -o 24\n"
+               "  GoSubtitle.exe -f movie.xml -r \"John:Jane\" -r \"Bob:Robert\"\n"
+               "  GoSubtitle.exe -f movie.xml -t \"WeAnimate:We Animate\"\n"
+               "  GoSubtitle.exe -f movie.xml --max-words 15 --verbose\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    # GUI mode flag
+    parser.add_argument(
+        '-g', '--gui',
+        action='store_true',
+        help='Force GUI mode even when console is available'
+    )
+    
+    # Input/Output files
+    parser.add_argument(
+        '-f', '--file',
+        type=str,
+        metavar='PATH',
+        help='Input Movie XML file path'
+    )
+    
+    parser.add_argument(
+        '-s', '--srt',
+        type=str,
+        metavar='PATH',
+        help='Output SRT file path (default: same as input with .srt extension)'
+    )
+    
+    # Processing options
+    parser.add_argument(
+        '-o', '--offset',
+        type=float,
+        default=0,
+        metavar='FRAMES',
+        help='Offset all subtitles by the specified number of frames (can be negative)'
+    )
+    
+    parser.add_argument(
+        '-w', '--max-words',
+        type=int,
+        metavar='COUNT',
+        help='Maximum words per subtitle line (default: 10)'
+    )
+    
+    parser.add_argument(
+        '-r', '--replace',
+        action='append',
+        metavar='OLD:NEW',
+        dest='replace_list',
+        help='Replace speaker names in format "OldName:NewName" (can be used multiple times)'
+    )
+
+    parser.add_argument(
+        '-t', '--replace-text',
+        action='append',
+        metavar='OLD:NEW',
+        dest='replace_text_list',
+        help='Replace text content in format "OldText:NewText" (can be used multiple times)'
+    )
+    
+    # Output options
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Display detailed statistics about subtitles'
+    )
+    
+    parser.add_argument(
+        '--version',
+        action='version',
+        version='GoSubtitle 1.1.0',
+        help='Show program version and exit'
+    )
+    
+    return parser
+
+
 class Parameters:
     """
     Command-line parameter parser and manager.
@@ -17,86 +110,8 @@ class Parameters:
     """
     
     def __init__(self):
-        """Initialize the argument parser with all available options."""
-        self.parser = argparse.ArgumentParser(
-            description="GoSubtitle - Convert Movie XML files to SRT subtitles",
-            epilog="Examples:\n"
-                   "  GoSubtitle.exe -f movie.xml\n"
-                   "  GoSubtitle.exe -f movie.xml -s subtitles.srt -o 24\n"
-                   "  GoSubtitle.exe -f movie.xml -r \"John:Jane\" -r \"Bob:Robert\"\n"
-                   "  GoSubtitle.exe -f movie.xml -t \"WeAnimate:We Animate\"\n"
-                   "  GoSubtitle.exe -f movie.xml --max-words 15 --verbose\n",
-            formatter_class=argparse.RawDescriptionHelpFormatter
-        )
-        
-        # GUI mode flag
-        self.parser.add_argument(
-            '-g', '--gui',
-            action='store_true',
-            help='Force GUI mode even when console is available'
-        )
-        
-        # Input/Output files
-        self.parser.add_argument(
-            '-f', '--file',
-            type=str,
-            metavar='PATH',
-            help='Input Movie XML file path'
-        )
-        
-        self.parser.add_argument(
-            '-s', '--srt',
-            type=str,
-            metavar='PATH',
-            help='Output SRT file path (default: same as input with .srt extension)'
-        )
-        
-        # Processing options
-        self.parser.add_argument(
-            '-o', '--offset',
-            type=float,
-            default=0,
-            metavar='FRAMES',
-            help='Offset all subtitles by the specified number of frames (can be negative)'
-        )
-        
-        self.parser.add_argument(
-            '-w', '--max-words',
-            type=int,
-            metavar='COUNT',
-            help='Maximum words per subtitle line (default: 10)'
-        )
-        
-        self.parser.add_argument(
-            '-r', '--replace',
-            action='append',
-            metavar='OLD:NEW',
-            dest='replace_list',
-            help='Replace speaker names in format "OldName:NewName" (can be used multiple times)'
-        )
-
-        self.parser.add_argument(
-            '-t', '--replace-text',
-            action='append',
-            metavar='OLD:NEW',
-            dest='replace_text_list',
-            help='Replace text content in format "OldText:NewText" (can be used multiple times)'
-        )
-        
-        # Output options
-        self.parser.add_argument(
-            '-v', '--verbose',
-            action='store_true',
-            help='Display detailed statistics about subtitles'
-        )
-        
-        self.parser.add_argument(
-            '--version',
-            action='version',
-            version='GoSubtitle 1.1.0',
-            help='Show program version and exit'
-        )
-        
+        """Parse the command-line arguments using the shared parser."""
+        self.parser = _build_parser()
         self.args = self.parser.parse_args()
         
         # Process speaker replacements into a dictionary
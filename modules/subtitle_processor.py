@@ -5,12 +5,53 @@ This module handles all subtitle-related business logic including XML parsing,
 subtitle merging, splitting, and time formatting.
 """
 
-import xml.etree.ElementTree as ET
+import functools
 import logging
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+import os
+import re
+import sys
+from itertools import accumulate, chain
+from operator import attrgetter
+from typing import List, Iterable, Iterator, Optional, Tuple
+
+from lxml import etree as LET
 
 logger = logging.getLogger(__name__)
 
+# A sentence runs up to punctuation that ends a word (followed by whitespace
+# or the end of the paragraph); trailing text without punctuation is the
+# final sentence
+_SENTENCE_RE = re.compile(r'.*?[.!?:](?:\s+|$)|.+')
+
+
+@dataclass
+class Subtitle:
+    """
+    A single subtitle entry.
+    
+    Uses __slots__ rather than a per-instance dict, which keeps large movies
+    compact in memory and makes attribute access cheaper in hot loops. The
+    slots are declared by hand, as dataclass(slots=True) needs Python 3.10.
+    
+    Attributes:
+        start: Start time in frames
+        stop: Stop time in frames
+        text: Subtitle text
+        speaker: Speaker name
+    """
+    
+    __slots__ = ('start', 'stop', 'text', 'speaker')
+    
+    start: float
+    stop: float
+    text: str
+    speaker: str
+    
+    def copy(self) -> 'Subtitle':
+        """Return a shallow copy of this subtitle."""
+        return Subtitle(self.start, self.stop, self.text, self.speaker)
+
 
 class SubtitleProcessor:
     """
@@ -26,6 +67,7 @@ class SubtitleProcessor:
     DEFAULT_MAX_WORDS_PER_LINE = 10  # Maximum words per subtitle line
     DEFAULT_WORDS_PER_SECOND = 2.5  # Average speaking rate
     MIN_SUBTITLE_DURATION = 0.5  # Minimum duration in seconds
+    WRITE_BUFFER_SIZE = 1 << 20  # SRT file write buffer in bytes (1 MiB), used with srt_entries
     
     def __init__(
         self,
@@ -41,11 +83,10 @@ class SubtitleProcessor:
         """
         self.max_words_per_line = max_words_per_line
         self.words_per_second = words_per_second
-        self.tree: Optional[ET.ElementTree] = None
-        self.root: Optional[ET.Element] = None
         self.length: float = 0.0
+        self._merged_subtitles: List[Subtitle] = []
     
-    def parse_xml(self, file_path: str) -> List[Dict[str, any]]:
+    def parse_xml(self, file_path: str) -> List[Subtitle]:
         """
         Parse a Movie XML file and extract subtitle information.
         
@@ -53,34 +94,32 @@ class SubtitleProcessor:
             file_path: Path to the XML file to parse
             
         Returns:
-            List of subtitle dictionaries with 'start', 'stop', 'text', and 'speaker' keys
+            List of subtitles
             
         Raises:
             FileNotFoundError: If the file doesn't exist
-            ET.ParseError: If the XML is malformed
+            LET.XMLSyntaxError: If the XML is malformed
             ValueError: If required XML elements are missing
         """
         logger.info(f"Parsing XML file: {file_path}")
         
         try:
-            self.tree = ET.parse(file_path)
-            self.root = self.tree.getroot()
-            
-            # Validate that duration attribute exists
-            duration_str = self.root.get("duration")
-            if duration_str is None:
-                raise ValueError("XML root element missing 'duration' attribute")
-            
-            self.length = float(duration_str)
-            logger.info(f"XML parsed successfully. Duration: {self.length} frames")
-            
-            # Convert XML data to dictionary format
-            subtitles = self._convert_to_dict()
+            # Results are memoized per file version: the modification time is
+            # part of the key, so editing the file invalidates the entry
+            mtime_ns = os.stat(file_path).st_mtime_ns
+            self.length, self._merged_subtitles, subtitles = _parse_xml_cached(
+                file_path,
+                mtime_ns,
+                self.max_words_per_line,
+                self.words_per_second
+            )
             
             logger.info(f"Extracted {len(subtitles)} subtitles")
-            return subtitles
             
-        except ET.ParseError as e:
+            # Callers edit subtitles in place, so never hand out the cached objects
+            return [subtitle.copy() for subtitle in subtitles]
+            
+        except LET.XMLSyntaxError as e:
             logger.error(f"XML parse error: {e}")
             raise
         except ValueError as e:
@@ -90,71 +129,162 @@ class SubtitleProcessor:
             logger.error(f"Unexpected error parsing XML: {e}")
             raise
     
-    def _convert_to_dict(self) -> List[Dict[str, any]]:
+    def _read_xml(self, file_path: str) -> List[Subtitle]:
         """
-        Convert XML elements to a list of subtitle dictionaries.
+        Read a Movie XML file from disk and extract subtitle information.
         
+        Args:
+            file_path: Path to the XML file to read
+            
         Returns:
-            List of subtitle dictionaries, sorted by start time, with overlapping
-            subtitles merged and long subtitles split
+            List of subtitles
+        """
+        # Only the root start tag is needed for the duration, so stop
+        # after the first event instead of building the whole tree
+        with open(file_path, 'rb') as f:
+            _, root = next(iter(LET.iterparse(f, events=('start',))))
+            duration_str = root.get("duration")
+        
+        # Validate that duration attribute exists
+        if duration_str is None:
+            raise ValueError("XML root element missing 'duration' attribute")
+        
+        self.length = float(duration_str)
+        logger.info(f"XML parsed successfully. Duration: {self.length} frames")
+        
+        # Convert XML data to subtitles
+        return self._convert_to_subtitles(file_path)
+    
+    def _convert_to_subtitles(self, file_path: str) -> List[Subtitle]:
         """
-        subtitles = []
+        Convert XML elements to a list of subtitles.
         
-        # Find all sound elements with tts='1'
-        sound_elements = self.root.findall(".//sound[@tts='1']")
+        The file is streamed with iterparse so only one sound element is kept
+        in memory at a time, regardless of the size of the movie.
+        
+        Args:
+            file_path: Path to the XML file to read sound elements from
+        
+        Returns:
+            List of subtitles, sorted by start time, with overlapping
+            subtitles merged and long subtitles split
+        """
+        sounds = []
+        found_tts = False
+        
+        with open(file_path, 'rb') as f:
+            for _, sound in LET.iterparse(f, tag='sound'):
+                # Only sound elements with tts='1' carry subtitle data
+                if sound.get('tts') == '1':
+                    found_tts = True
+                    fields = self._read_sound(sound)
+                    if fields is not None:
+                        sounds.append(fields)
+                
+                # Free the processed element and any siblings parsed before it
+                sound.clear()
+                while sound.getprevious() is not None:
+                    del sound.getparent()[0]
         
-        if not sound_elements:
+        if not found_tts:
             logger.warning("No TTS sound elements found in XML")
+            self._merged_subtitles = []
             return []
         
-        for sound in sound_elements:
-            try:
-                start_elem = sound.find("start")
-                stop_elem = sound.find("stop")
-                text_elem = sound.find("ttsdata/text")
-                voice_elem = sound.find("ttsdata/voice")
-                
-                # Validate all required elements exist
-                if start_elem is None or stop_elem is None:
-                    logger.warning("Skipping sound element: missing start or stop")
-                    continue
-                
-                start = float(start_elem.text) if start_elem.text else 0.0
-                stop = float(stop_elem.text) if stop_elem.text else 0.0
-                text = text_elem.text if text_elem is not None and text_elem.text else ""
-                speaker = voice_elem.text if voice_elem is not None and voice_elem.text else "Unknown"
-                
-                # Skip empty subtitles
-                if not text.strip():
-                    logger.debug(f"Skipping empty subtitle at {start}")
-                    continue
-                
-                subtitles.append({
-                    'start': start,
-                    'stop': stop,
-                    'text': text.strip(),
-                    'speaker': speaker.capitalize()
-                })
-                
-            except (ValueError, AttributeError) as e:
-                logger.warning(f"Error processing sound element: {e}")
-                continue
+        # Normalize text and speakers after parsing to keep the parse loop
+        # tight: strip each text once, and capitalize and intern each distinct
+        # voice once so repeated speaker names share a single string (which
+        # also lets the speaker comparisons when merging short-circuit)
+        texts = [text.strip() for _, _, text, _ in sounds]
+        speaker_names = {
+            voice: sys.intern(voice.capitalize())
+            for voice in {voice for _, _, _, voice in sounds}
+        }
+        
+        # Skip empty subtitles
+        subtitles = [
+            Subtitle(start, stop, text, speaker_names[voice])
+            for (start, stop, _, voice), text in zip(sounds, texts)
+            if text
+        ]
+        if len(subtitles) < len(sounds):
+            logger.debug(f"Skipped {len(sounds) - len(subtitles)} empty subtitle(s)")
         
         # Sort subtitles by start time
-        subtitles.sort(key=lambda x: x['start'])
+        subtitles.sort(key=attrgetter('start'))
         
-        # Merge overlapping subtitles
-        merged_subtitles = self._merge_overlapping(subtitles)
+        # Merge overlapping subtitles, keeping them so they can be re-split
+        self._merged_subtitles = self._merge_overlapping(subtitles)
         
         # Split long subtitles into multiple entries
-        split_subtitles = []
-        for subtitle in merged_subtitles:
-            split_entries = self._split_subtitle_entry(subtitle)
-            split_subtitles.extend(split_entries)
+        return self.split_subtitles()
+    
+    def split_subtitles(self, max_words_per_line: Optional[int] = None) -> List[Subtitle]:
+        """
+        Split the merged subtitles from the last parsed XML file.
+        
+        Lets the word limit change without re-reading and re-parsing the file.
+        
+        Args:
+            max_words_per_line: New maximum number of words per subtitle line,
+                or None to keep the current limit
+            
+        Returns:
+            List of new subtitles with long subtitles split
+        """
+        if max_words_per_line is not None:
+            self.max_words_per_line = max_words_per_line
         
-        return split_subtitles
+        # Flatten the per-subtitle segments into one list in a single C-level pass
+        return list(chain.from_iterable(
+            map(self._split_subtitle_entry, self._merged_subtitles)
+        ))
+    
+    def _read_sound(self, sound: LET._Element) -> Optional[Tuple[float, float, str, str]]:
+        """
+        Read the raw subtitle fields from a single TTS sound element.
+        
+        Args:
+            sound: A sound element with tts='1'
+            
+        Returns:
+            Tuple of start, stop, unstripped text and raw voice name, or None
+            if the element is invalid
+        """
+        try:
+            start_elem = stop_elem = text_elem = voice_elem = None
+            
+            # Walk the children once instead of running a find() scan per field
+            for child in sound:
+                tag = child.tag
+                if tag == 'start':
+                    start_elem = child
+                elif tag == 'stop':
+                    stop_elem = child
+                elif tag == 'ttsdata':
+                    for data in child:
+                        if data.tag == 'text':
+                            text_elem = data
+                        elif data.tag == 'voice':
+                            voice_elem = data
+            
+            # Validate all required elements exist
+            if start_elem is None or stop_elem is None:
+                logger.warning("Skipping sound element: missing start or stop")
+                return None
+            
+            start = float(start_elem.text) if start_elem.text else 0.0
+            stop = float(stop_elem.text) if stop_elem.text else 0.0
+            text = text_elem.text if text_elem is not None and text_elem.text else ""
+            voice = voice_elem.text if voice_elem is not None and voice_elem.text else "Unknown"
+            
+            return start, stop, text, voice
+            
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Error processing sound element: {e}")
+            return None
     
-    def _merge_overlapping(self, subtitles: List[Dict[str, any]]) -> List[Dict[str, any]]:
+    def _merge_overlapping(self, subtitles: List[Subtitle]) -> List[Subtitle]:
         """
         Merge overlapping subtitles.
         
@@ -162,44 +292,66 @@ class SubtitleProcessor:
         and text merged appropriately.
         
         Args:
-            subtitles: List of subtitle dictionaries sorted by start time
+            subtitles: List of subtitles sorted by start time
             
         Returns:
-            List of merged subtitle dictionaries
+            List of merged subtitles
         """
         if not subtitles:
             return []
         
         merged_subtitles = []
         
-        for subtitle in subtitles:
-            # Check if this subtitle overlaps with the last merged one
-            if merged_subtitles and subtitle['start'] < merged_subtitles[-1]['stop']:
-                # Overlapping - merge them
-                last = merged_subtitles[-1]
-                
-                # Combine speakers if different
-                if subtitle['speaker'] != last['speaker']:
-                    combined_speaker = f"{last['speaker']}/{subtitle['speaker']}"
-                else:
-                    combined_speaker = last['speaker']
-                
-                # Combine text
-                combined_text = f"{last['text']}\n{subtitle['text']}"
-                
-                # Update the last subtitle with merged data
-                last['speaker'] = combined_speaker
-                last['text'] = combined_text
-                last['stop'] = max(last['stop'], subtitle['stop'])
-                
-                logger.debug(f"Merged overlapping subtitles at {subtitle['start']}")
+        # Find runs of overlapping subtitles in one pass, tracking the latest
+        # stop time of the current run
+        group = [subtitles[0]]
+        group_stop = subtitles[0].stop
+        
+        for subtitle in subtitles[1:]:
+            if subtitle.start < group_stop:
+                # Overlapping - add to the current run
+                group.append(subtitle)
+                group_stop = max(group_stop, subtitle.stop)
             else:
-                # No overlap - add as new subtitle
-                merged_subtitles.append(subtitle.copy())
+                # No overlap - close the run and start a new one
+                merged_subtitles.append(self._combine_group(group, group_stop))
+                group = [subtitle]
+                group_stop = subtitle.stop
         
+        merged_subtitles.append(self._combine_group(group, group_stop))
         return merged_subtitles
     
-    def _split_subtitle_entry(self, subtitle: Dict[str, any]) -> List[Dict[str, any]]:
+    @staticmethod
+    def _combine_group(group: List[Subtitle], stop: float) -> Subtitle:
+        """
+        Combine a run of overlapping subtitles into a single subtitle.
+        
+        Args:
+            group: Overlapping subtitles sorted by start time
+            stop: Latest stop time within the run
+            
+        Returns:
+            New subtitle spanning the whole run
+        """
+        merged = group[0].copy()
+        if len(group) == 1:
+            return merged
+        
+        # Combine speakers, appending each one that differs from the combination so far
+        speaker = merged.speaker
+        for subtitle in group[1:]:
+            if subtitle.speaker != speaker:
+                speaker = f"{speaker}/{subtitle.speaker}"
+        
+        # Combine text with a single join rather than growing it pairwise
+        merged.speaker = speaker
+        merged.text = '\n'.join(subtitle.text for subtitle in group)
+        merged.stop = stop
+        
+        logger.debug(f"Merged {len(group)} overlapping subtitles at {merged.start}")
+        return merged
+    
+    def _split_subtitle_entry(self, subtitle: Subtitle) -> List[Subtitle]:
         """
         Split a subtitle entry into multiple entries based on sentence boundaries and word count.
         
@@ -207,91 +359,57 @@ class SubtitleProcessor:
         on word count and speaking rate.
         
         Args:
-            subtitle: A subtitle dictionary with 'start', 'stop', 'text', and 'speaker'
+            subtitle: The subtitle to split
             
         Returns:
-            List of subtitle dictionaries (one or more)
+            List of new subtitles (one or more)
         """
-        text = subtitle['text']
+        text = subtitle.text
         if not text:
-            return [subtitle]
-        
-        # Sentence ending punctuation
-        sentence_endings = ['. ', '! ', '? ', ': ']
+            return [subtitle.copy()]
         
         segments = []
+        max_words = max(self.max_words_per_line, 1)
         
         # Split by existing newlines first (preserve intentional breaks)
         paragraphs = text.split('\n')
         
         for paragraph in paragraphs:
-            words = paragraph.split()
-            current_segment = ""
-            
-            i = 0
-            while i < len(words):
-                word = words[i]
-                
-                # Check if adding this word would exceed the word limit
-                current_word_count = len(current_segment.split()) if current_segment else 0
-                
-                if current_segment:
-                    test_segment = current_segment + " " + word
-                else:
-                    test_segment = word
-                
-                # Check if current segment ends with sentence ending punctuation
-                ends_with_sentence = any(
-                    current_segment.rstrip().endswith(ending.strip()) 
-                    for ending in sentence_endings
-                )
-                
-                # Decide whether to start a new segment
-                if current_segment and (ends_with_sentence or current_word_count >= self.max_words_per_line):
-                    segments.append(current_segment.strip())
-                    current_segment = word
-                else:
-                    current_segment = test_segment
-                
-                i += 1
-            
-            # Add remaining text
-            if current_segment:
-                segments.append(current_segment.strip())
-        
-        # If only one segment, return the original subtitle
+            # Each sentence starts a new segment, and sentences longer than
+            # the word limit are broken into chunks of at most max_words
+            for sentence in _SENTENCE_RE.findall(paragraph):
+                words = sentence.split()
+                for i in range(0, len(words), max_words):
+                    segments.append(' '.join(words[i:i + max_words]))
+        
+        # If only one segment, return a copy of the original subtitle
         if len(segments) <= 1:
-            return [subtitle]
+            return [subtitle.copy()]
         
         # Create multiple subtitle entries with timing based on estimated speech duration
-        result = []
-        total_duration = subtitle['stop'] - subtitle['start']
-        
-        # Calculate estimated duration for each segment based on word count
-        segment_word_counts = [len(seg.split()) for seg in segments]
-        total_words = sum(segment_word_counts)
+        total_duration = subtitle.stop - subtitle.start
         
-        # Calculate ideal duration for each segment based on speaking rate
+        # Calculate ideal duration for each segment based on word count and speaking rate
         segment_durations = [
-            word_count / self.words_per_second 
-            for word_count in segment_word_counts
+            len(seg.split()) / self.words_per_second
+            for seg in segments
         ]
         total_ideal_duration = sum(segment_durations)
         
-        # If our ideal total exceeds available time, scale proportionally
-        # If we have extra time, distribute it proportionally as well
+        # Scale proportionally to the available time (whether our ideal total
+        # exceeds it or leaves time spare) while enforcing the minimum duration
+        # per subtitle in the same pass
+        min_duration_frames = self.MIN_SUBTITLE_DURATION * self.FPS
         if total_ideal_duration > 0:
             scale_factor = total_duration / total_ideal_duration
-            segment_durations = [duration * scale_factor for duration in segment_durations]
+            segment_durations = [
+                max(duration * scale_factor, min_duration_frames)
+                for duration in segment_durations
+            ]
         else:
             # Fallback to equal distribution if calculation fails
-            segment_durations = [total_duration / len(segments)] * len(segments)
-        
-        # Ensure minimum duration per subtitle
-        min_duration_frames = self.MIN_SUBTITLE_DURATION * self.FPS
-        for i in range(len(segment_durations)):
-            if segment_durations[i] < min_duration_frames:
-                segment_durations[i] = min_duration_frames
+            equal_duration = max(total_duration / len(segments), min_duration_frames)
+            segment_durations = [equal_duration] * len(segments)
         
         # Adjust if total exceeds available time after applying minimums
         adjusted_total = sum(segment_durations)
@@ -299,31 +417,29 @@ class SubtitleProcessor:
             scale_factor = total_duration / adjusted_total
             segment_durations = [duration * scale_factor for duration in segment_durations]
         
-        # Create subtitle entries with calculated timing
-        current_start = subtitle['start']
-        for i, segment in enumerate(segments):
-            duration = segment_durations[i]
-            new_subtitle = {
-                'start': current_start,
-                'stop': current_start + duration,
-                'text': segment,
-                'speaker': subtitle['speaker']
-            }
-            result.append(new_subtitle)
-            current_start += duration
+        # Each segment starts where the previous one ends
+        segment_starts = accumulate(segment_durations[:-1], initial=subtitle.start)
+        speaker = subtitle.speaker
+        result = [
+            Subtitle(start, start + duration, segment, speaker)
+            for start, duration, segment in zip(segment_starts, segment_durations, segments)
+        ]
         
         # Adjust the last subtitle to end exactly at the original stop time
-        if result:
-            result[-1]['stop'] = subtitle['stop']
+        result[-1].stop = subtitle.stop
         
         logger.debug(f"Split subtitle into {len(result)} segments")
         return result
     
     @staticmethod
+    @functools.lru_cache(maxsize=1 << 16)
     def format_time(frames: float, fps: int = FPS) -> str:
         """
         Convert frame number to SRT timestamp format.
         
+        Results are memoized, as the timeline formats the same times again
+        whenever its labels are refreshed.
+        
         Args:
             frames: Number of frames from the start
             fps: Frames per second (defaults to 24)
@@ -331,28 +447,94 @@ class SubtitleProcessor:
         Returns:
             Formatted timestamp string (HH:MM:SS,mmm)
         """
-        # Convert frames to seconds
-        seconds = frames / fps
-
-        # Format as SRT timestamp (HH:MM:SS,mmm)
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
+        # Convert frames to whole milliseconds, then split with integer divmod
+        total_ms = int(frames * 1000 // fps)
+        hours, remainder = divmod(total_ms, 3_600_000)
+        minutes, remainder = divmod(remainder, 60_000)
+        secs, millis = divmod(remainder, 1000)
 
-        return f"{hours:02}:{minutes:02}:{secs:02},{millis:03}"
+        # Format as SRT timestamp (HH:MM:SS,mmm); printf-style formatting of
+        # the integer parts is noticeably cheaper than f-string format specs
+        return '%02d:%02d:%02d,%03d' % (hours, minutes, secs, millis)
+    
+    @staticmethod
+    def format_times(frames: Iterable[float], fps: int = FPS) -> List[str]:
+        """
+        Convert many frame numbers to SRT timestamp format in one pass.
+        
+        Equivalent to calling format_time for each value, with the lookup
+        hoisted out of the loop for bulk conversions such as a batch of
+        timeline labels.
+        
+        Args:
+            frames: Frame numbers from the start
+            fps: Frames per second (defaults to 24)
+            
+        Returns:
+            List of formatted timestamp strings (HH:MM:SS,mmm)
+        """
+        format_time = SubtitleProcessor.format_time
+        return [format_time(frame, fps) for frame in frames]
     
     @staticmethod
-    def apply_offset(subtitles: List[Dict[str, any]], offset: float) -> None:
+    def srt_entries(subtitles: Iterable[Subtitle], fps: int = FPS) -> Iterator[str]:
+        """
+        Format subtitles as SRT entries, one at a time.
+        
+        Entries are produced lazily so callers can stream them to a file
+        without holding the whole SRT text in memory; open the file with
+        buffering=WRITE_BUFFER_SIZE so the small writes are batched.
+        
+        Args:
+            subtitles: Subtitles to format, in output order
+            fps: Frames per second (defaults to 24)
+            
+        Yields:
+            One numbered SRT entry, including its trailing blank line
+        """
+        format_time = SubtitleProcessor.format_time
+        for idx, subtitle in enumerate(subtitles, start=1):
+            yield (
+                f"{idx}\n{format_time(subtitle.start, fps)} --> {format_time(subtitle.stop, fps)}\n"
+                f"{subtitle.speaker}: {subtitle.text}\n\n"
+            )
+    
+    @staticmethod
+    def apply_offset(subtitles: List[Subtitle], offset: float) -> None:
         """
         Apply a time offset to all subtitles.
         
         Args:
-            subtitles: List of subtitle dictionaries to modify in-place
+            subtitles: List of subtitles to modify in-place
             offset: Offset in frames to add to start and stop times
         """
         for subtitle in subtitles:
-            subtitle['start'] += offset
-            subtitle['stop'] += offset
+            subtitle.start += offset
+            subtitle.stop += offset
         
         logger.info(f"Applied offset of {offset} frames to {len(subtitles)} subtitles")
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_xml_cached(
+    file_path: str,
+    mtime_ns: int,
+    max_words_per_line: int,
+    words_per_second: float
+) -> Tuple[float, List[Subtitle], List[Subtitle]]:
+    """
+    Read and process a Movie XML file, memoizing the result.
+    
+    Args:
+        file_path: Path to the XML file to parse
+        mtime_ns: Modification time of the file, used only as part of the cache key
+        max_words_per_line: Maximum number of words allowed per subtitle line
+        words_per_second: Average speaking rate for timing calculations
+        
+    Returns:
+        Tuple of the movie length in frames, the merged subtitles and the split
+        subtitles. The lists are shared between callers and must not be modified.
+    """
+    processor = SubtitleProcessor(max_words_per_line, words_per_second)
+    subtitles = processor._read_xml(file_path)
+    return processor.length, processor._merged_subtitles, subtitles
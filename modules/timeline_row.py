@@ -0,0 +1,68 @@
+"""
+Timeline row module for GoSubtitle application.
+
+This module contains the TimelineRow widget which shows a single subtitle
+on the main window's timeline.
+"""
+
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QFocusEvent
+from PyQt6.QtWidgets import QWidget, QFrame, QVBoxLayout, QLabel, QLineEdit, QPlainTextEdit
+
+
+class ContentEdit(QPlainTextEdit):
+    """
+    Plain text editor that reports when an edit is finished.
+
+    Like QLineEdit.editingFinished, the signal is emitted when the editor
+    loses focus after its text was changed, rather than on every keystroke.
+    """
+
+    editingFinished = pyqtSignal()
+
+    def commit(self) -> None:
+        """Emit editingFinished if the text changed since the last emit."""
+        if self.document().isModified():
+            self.document().setModified(False)
+            self.editingFinished.emit()
+
+    def focusOutEvent(self, event: QFocusEvent) -> None:
+        """Commit the edit when the editor loses focus."""
+        super(ContentEdit, self).focusOutEvent(event)
+        self.commit()
+
+
+class TimelineRow(QWidget):
+    """
+    Timeline widget for a single subtitle.
+
+    Built directly in code rather than from a .ui file, as one is created
+    for every subtitle on the timeline. Exposes the timing ``label``, the
+    ``speaker`` field and the ``content`` editor.
+    """
+
+    def __init__(self, parent: QWidget = None):
+        """
+        Create the row and its label, speaker and content children.
+
+        Args:
+            parent: Optional parent widget
+        """
+        super(TimelineRow, self).__init__(parent)
+
+        frame = QFrame(self)
+        frame.setFrameShape(QFrame.Shape.StyledPanel)
+        frame.setFrameShadow(QFrame.Shadow.Raised)
+
+        self.label = QLabel(frame)
+        self.speaker = QLineEdit(frame)
+        self.content = ContentEdit(frame)
+        self.content.setPlaceholderText("This is an example subtitle.")
+
+        frame_layout = QVBoxLayout(frame)
+        frame_layout.addWidget(self.label)
+        frame_layout.addWidget(self.speaker)
+        frame_layout.addWidget(self.content)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(frame)
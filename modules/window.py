@@ -4,21 +4,22 @@ Main window module for GoSubtitle application.
 This module contains the MainWindow class which manages the GUI and user interactions.
 """
 
+from bisect import bisect_left, insort
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, List
 import logging
+import sys
 
-from PyQt6.QtWidgets import QMainWindow, QMessageBox, QFileDialog, QWidget
+from PyQt6.QtWidgets import (
+    QApplication, QMainWindow, QMessageBox, QFileDialog, QWidget, QLineEdit, QPlainTextEdit, QProgressDialog
+)
+from PyQt6.QtCore import Qt, QObject, QRunnable, QSignalBlocker, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon
 from PyQt6 import uic
 
-from .subtitle_processor import SubtitleProcessor
+from .subtitle_processor import SubtitleProcessor, Subtitle
+from .timeline_row import ContentEdit, TimelineRow
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # Path configuration - paths relative to this file
@@ -26,7 +27,77 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 UI_DIR = BASE_DIR / "ui"
 
 
-class MainWindow(QMainWindow):
+
+def _load_main_window_form() -> type:
+    """
+    Get the form class for the main window.
+    
+    Uses the module precompiled by tools/build_ui.sh, so startup skips
+    parsing the .ui file, in frozen builds or when it is at least as new as
+    the .ui file. Otherwise the .ui file is compiled at import, so edits
+    made in Qt Designer are never shadowed by a stale generated module.
+    
+    Returns:
+        The Ui_MainWindow form class
+    """
+    form_path = UI_DIR / "main_window.ui"
+    compiled_path = Path(__file__).with_name("_ui_main_window.py")
+    
+    use_compiled = getattr(sys, 'frozen', False)
+    if not use_compiled and compiled_path.exists():
+        use_compiled = compiled_path.stat().st_mtime >= form_path.stat().st_mtime
+        if not use_compiled:
+            logger.warning(f"{compiled_path.name} is older than {form_path.name}; run tools/build_ui.sh")
+    
+    if use_compiled:
+        try:
+            from ._ui_main_window import Ui_MainWindow
+            return Ui_MainWindow
+        except ImportError:
+            pass
+    
+    form_class, _ = uic.loadUiType(str(form_path))
+    return form_class
+
+
+Ui_MainWindow = _load_main_window_form()
+
+
+class ParseSignals(QObject):
+    """Signals used by ParseJob to report back to the GUI thread."""
+    
+    finished = pyqtSignal(str, object)  # file path, list of subtitles
+    failed = pyqtSignal(str, object)  # file path, raised exception
+
+
+class ParseJob(QRunnable):
+    """Parses a Movie XML file on a thread pool thread."""
+    
+    def __init__(self, processor: SubtitleProcessor, file_path: str, signals: ParseSignals):
+        """
+        Prepare a parse of the given file.
+        
+        Args:
+            processor: Processor used to parse the file
+            file_path: Path to the XML file to parse
+            signals: Signals to emit the result or error on
+        """
+        super(ParseJob, self).__init__()
+        self.processor = processor
+        self.file_path = file_path
+        self.signals = signals
+    
+    def run(self) -> None:
+        """Parse the file and emit the subtitles, or the error raised."""
+        try:
+            subtitles = self.processor.parse_xml(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, e)
+        else:
+            self.signals.finished.emit(self.file_path, subtitles)
+
+
+class MainWindow(QMainWindow, Ui_MainWindow):
     """
     Main application window for GoSubtitle.
     
@@ -34,12 +105,22 @@ class MainWindow(QMainWindow):
     and exporting to SRT format.
     """
     
+    # Configuration constants
+    OFFSET_DEBOUNCE_MS = 150
+    TIMELINE_BATCH_SIZE = 50
+    
     def __init__(self):
         """Initialize the main window and set up UI connections."""
         super(MainWindow, self).__init__()
         
-        # Load UI from file
-        uic.loadUi(str(UI_DIR / "main_window.ui"), self)
+        # Configure logging for GUI mode (no-op if already configured)
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        
+        # Build the UI from the compiled form
+        self.setupUi(self)
         # Set window properties
         self.icon = BASE_DIR / "assets" / "icon.ico"
         self.setWindowTitle("GoSubtitle")
@@ -51,15 +132,43 @@ class MainWindow(QMainWindow):
         # Connect UI signals to slots
         self.openButton.clicked.connect(self.open_file)
         self.saveButton.clicked.connect(self.save_srt)
-        self.offsetSpinBox.valueChanged.connect(self.offset_beginning)
+        self.offsetSpinBox.valueChanged.connect(self._queue_offset)
         self.massButtonoSave.clicked.connect(self.mass_replace_speaker)
         self.textReplaceButton.clicked.connect(self.mass_replace_text)
         self.maxWordsSpinBox.valueChanged.connect(self.update_max_words_per_line)
         
+        # Build more timeline objects as the timeline is scrolled towards its end
+        timeline_bar = self.timelineScrollArea.horizontalScrollBar()
+        timeline_bar.valueChanged.connect(self._load_more_timeline_rows)
+        timeline_bar.rangeChanged.connect(self._load_more_timeline_rows)
+        
         # State variables
-        self.subtitles: List[Dict[str, any]] = []
+        self.subtitles: List[Subtitle] = []
         self.current_offset: float = 0.0
         self.timeline_widgets: List[QWidget] = []
+        self._timeline_subtitles: List[Subtitle] = []
+        self._widgets_built_for_len: int = 0
+        self._speaker_index: Dict[str, List[int]] = {}
+        self._sorted_speakers: List[str] = []
+        
+        # Map each timeline field back to its subtitle index, so all rows
+        # share one slot per signal
+        self._speaker_widgets: Dict[QLineEdit, int] = {}
+        self._content_widgets: Dict[QPlainTextEdit, int] = {}
+        
+        # Coalesce rapid offset changes (e.g. holding an arrow key) so only
+        # the last value of a burst is applied to the timeline
+        self._pending_offset: int = 0
+        self._offset_timer = QTimer(self)
+        self._offset_timer.setSingleShot(True)
+        self._offset_timer.setInterval(self.OFFSET_DEBOUNCE_MS)
+        self._offset_timer.timeout.connect(self._apply_pending_offset)
+        
+        # Files are parsed on the thread pool; results arrive through these signals
+        self._parse_signals = ParseSignals(self)
+        self._parse_signals.finished.connect(self._on_parse_finished)
+        self._parse_signals.failed.connect(self._on_parse_failed)
+        self._parse_progress: QProgressDialog = None
         
         logger.info("MainWindow initialized successfully")
     
@@ -68,7 +177,7 @@ class MainWindow(QMainWindow):
         Open a file dialog to select and load a Movie XML file.
         
         Returns:
-            True if file was loaded successfully, False otherwise
+            True if loading the file was started, False otherwise
         """
         file_dialog = QFileDialog(self)
         file_path, file_type = file_dialog.getOpenFileName(
@@ -89,129 +198,261 @@ class MainWindow(QMainWindow):
     
     def parse_xml(self, file_path: str) -> bool:
         """
-        Parse the XML file and load subtitles.
+        Start parsing the XML file in the background.
+        
+        The window stays responsive while the file is parsed; subtitles are
+        loaded by _on_parse_finished once the parse completes.
         
         Args:
             file_path: Path to the XML file to parse
             
         Returns:
-            True if parsing was successful, False otherwise
+            True if parsing was started, False if a parse is already running
         """
-        try:
-            logger.info(f"Attempting to parse XML file: {file_path}")
-            self.subtitles = self.processor.parse_xml(file_path)
-            
-            if not self.subtitles:
-                QMessageBox.warning(
-                    self, 
-                    "No Subtitles Found", 
-                    "The XML file contains no valid subtitle data."
-                )
-                logger.warning("No subtitles found in XML file")
-                return False
-            
-            # Reset offset when loading new file
-            self.current_offset = 0.0
-            self.offsetSpinBox.setEnabled(True)
-            self.offsetSpinBox.setValue(0)
-            
-            self.display_subtitles(self.subtitles)
-            self.populate_speaker_combo()
-            
-            logger.info(f"Successfully loaded {len(self.subtitles)} subtitles")
-            return True
-            
-        except FileNotFoundError:
+        if self._parse_progress is not None:
+            logger.warning("Attempted to open a file while another is being parsed")
+            return False
+        
+        logger.info(f"Attempting to parse XML file: {file_path}")
+        
+        # Busy indicator, only shown if the parse takes a noticeable time
+        self._parse_progress = QProgressDialog("Reading Movie XML file...", None, 0, 0, self)
+        self._parse_progress.setWindowTitle("GoSubtitle")
+        self._parse_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._parse_progress.setMinimumDuration(500)
+        self.openButton.setEnabled(False)
+        
+        QThreadPool.globalInstance().start(ParseJob(self.processor, file_path, self._parse_signals))
+        return True
+    
+    def _finish_parse(self) -> None:
+        """Close the progress dialog and allow opening another file."""
+        if self._parse_progress is not None:
+            self._parse_progress.close()
+            self._parse_progress.deleteLater()
+            self._parse_progress = None
+        self.openButton.setEnabled(True)
+    
+    def _on_parse_finished(self, file_path: str, subtitles: List[Subtitle]) -> None:
+        """
+        Load the subtitles parsed from a file into the window.
+        
+        Args:
+            file_path: Path of the parsed XML file
+            subtitles: Subtitles extracted from the file
+        """
+        self._finish_parse()
+        self.subtitles = subtitles
+        
+        if not self.subtitles:
+            QMessageBox.warning(
+                self, 
+                "No Subtitles Found", 
+                "The XML file contains no valid subtitle data."
+            )
+            logger.warning("No subtitles found in XML file")
+            return
+        
+        # Reset offset when loading new file
+        self._offset_timer.stop()
+        self.current_offset = 0.0
+        self.offsetSpinBox.setEnabled(True)
+        self.offsetSpinBox.setValue(0)
+        
+        self.display_subtitles(self.subtitles)
+        self.populate_speaker_combo()
+        
+        logger.info(f"Successfully loaded {len(self.subtitles)} subtitles from {file_path}")
+    
+    def _on_parse_failed(self, file_path: str, error: Exception) -> None:
+        """
+        Report an error raised while parsing a file.
+        
+        Args:
+            file_path: Path of the XML file that failed to parse
+            error: Exception raised by the parser
+        """
+        self._finish_parse()
+        
+        if isinstance(error, FileNotFoundError):
             QMessageBox.critical(
                 self, 
                 "File Not Found", 
                 f"The file '{file_path}' was not found."
             )
             logger.error(f"File not found: {file_path}")
-            return False
-            
-        except Exception as e:
-            QMessageBox.critical(
-                self, 
-                "Error", 
-                f"Failed to read file: {str(e)}"
-            )
-            logger.error(f"Error parsing XML: {e}", exc_info=True)
-            return False
+            return
+        
+        QMessageBox.critical(
+            self, 
+            "Error", 
+            f"Failed to read file: {str(error)}"
+        )
+        logger.error(f"Error parsing XML: {error}", exc_info=error)
     
-    def display_subtitles(self, subtitles: List[Dict[str, any]]) -> None:
+    def display_subtitles(self, subtitles: List[Subtitle]) -> None:
         """
         Display subtitles in the timeline layout.
         
-        Creates a timeline object widget for each subtitle and sets up proper
-        tab ordering for intuitive keyboard navigation.
+        Only the first batch of timeline objects is created here; the rest
+        are created in batches as the timeline is scrolled, so large files
+        do not build thousands of widgets up front. When the number of
+        subtitles is unchanged, the existing timeline objects are reused.
         
         Args:
-            subtitles: List of subtitle dictionaries to display
+            subtitles: List of subtitles to display
         """
-        # Clear existing timeline objects
-        while self.timelineLayout.layout().count():
-            item = self.timelineLayout.layout().takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Repaint once after the rebuild rather than after each change
+        self.setUpdatesEnabled(False)
+        try:
+            if self.timeline_widgets and len(subtitles) == self._widgets_built_for_len:
+                # Same rows as before: update them in place instead of
+                # destroying and recreating every timeline object
+                self._timeline_subtitles = subtitles
+                self._refresh_timeline_rows()
+                return
+            
+            # Clear existing timeline objects
+            while self.timelineLayout.layout().count():
+                item = self.timelineLayout.layout().takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+            
+            self.timeline_widgets.clear()
+            self._speaker_widgets.clear()
+            self._content_widgets.clear()
+            self._timeline_subtitles = subtitles
+            self._widgets_built_for_len = len(subtitles)
+            
+            self._append_timeline_rows(self.TIMELINE_BATCH_SIZE)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        logger.info(f"Displaying {len(subtitles)} subtitles, {len(self.timeline_widgets)} timeline objects built")
+    
+    def _refresh_timeline_rows(self) -> None:
+        """Update the existing timeline objects from their subtitles."""
+        subtitles = self._timeline_subtitles[:len(self.timeline_widgets)]
+        labels = self._timeline_labels(subtitles)
+        for item, subtitle, label in zip(self.timeline_widgets, subtitles, labels):
+            item.label.setText(label)
+            with QSignalBlocker(item.speaker), QSignalBlocker(item.content):
+                item.speaker.setText(subtitle.speaker)
+                item.content.setPlainText(subtitle.text)
+        
+        logger.info(f"Refreshed {len(subtitles)} timeline objects in place")
+    
+    def _load_more_timeline_rows(self, *_) -> None:
+        """
+        Build the next batch of timeline objects once the timeline is
+        scrolled to within a page of its end (or does not fill the view).
+        """
+        if len(self.timeline_widgets) >= len(self._timeline_subtitles):
+            return
         
-        self.timeline_widgets.clear()
+        bar = self.timelineScrollArea.horizontalScrollBar()
+        if bar.value() >= bar.maximum() - bar.pageStep():
+            self._append_timeline_rows(self.TIMELINE_BATCH_SIZE)
+    
+    def _append_timeline_rows(self, count: int) -> None:
+        """
+        Create timeline objects for the next subtitles that have none yet.
+        
+        Tab ordering continues from the last existing timeline object for
+        intuitive keyboard navigation.
+        
+        Args:
+            count: Maximum number of timeline objects to create
+        """
+        start = len(self.timeline_widgets)
+        end = min(start + count, len(self._timeline_subtitles))
         
         # Keep track of previous widget for tab order
         previous_speaker_widget = None
         previous_content_widget = None
+        if self.timeline_widgets:
+            previous_speaker_widget = self.timeline_widgets[-1].speaker
+            previous_content_widget = self.timeline_widgets[-1].content
         
-        for idx, subtitle in enumerate(subtitles):
-            # Load a fresh copy of the timeline object UI
-            item = uic.loadUi(str(UI_DIR / "timeline_object.ui"))
-            
-            # Set subtitle information
-            start_time = SubtitleProcessor.format_time(subtitle['start'])
-            end_time = SubtitleProcessor.format_time(subtitle['stop'])
-            item.label.setText(f"Start: {start_time}, End: {end_time}")
-            item.speaker.setText(subtitle['speaker'])
-            item.content.setPlainText(subtitle['text'])
-            
-            # Make content editable
-            item.content.setReadOnly(False)
-            
-            # Connect speaker change with proper closure to capture correct index
-            def make_speaker_callback(index: int, widget: QWidget) -> callable:
-                """Create a callback that properly captures the index."""
-                def callback():
-                    self.change_speaker(index, widget.text())
-                return callback
-            
-            item.speaker.editingFinished.connect(
-                make_speaker_callback(idx, item.speaker)
-            )
-            
-            # Connect content change with proper closure
-            def make_content_callback(index: int, widget: QWidget) -> callable:
-                """Create a callback that properly captures the index."""
-                def callback():
-                    self.change_content(index, widget.toPlainText())
-                return callback
-            
-            item.content.textChanged.connect(
-                make_content_callback(idx, item.content)
-            )
-            
-            # Set up tab order - speaker -> content -> next speaker
-            if previous_content_widget is not None:
-                self.setTabOrder(previous_content_widget, item.speaker)
-            if previous_speaker_widget is not None:
-                self.setTabOrder(item.speaker, item.content)
-            
-            previous_speaker_widget = item.speaker
-            previous_content_widget = item.content
-            
-            # Add to layout and track widget
-            self.timelineLayout.layout().addWidget(item)
-            self.timeline_widgets.append(item)
+        # Format the timing labels of the whole batch in one pass
+        labels = self._timeline_labels(self._timeline_subtitles[start:end])
+        
+        # Hold off repaints of the timeline until the whole batch is added
+        contents = self.scrollAreaWidgetContents
+        contents.setUpdatesEnabled(False)
+        try:
+            for idx, label in zip(range(start, end), labels):
+                subtitle = self._timeline_subtitles[idx]
+                
+                # Create a fresh timeline object
+                item = TimelineRow()
+                
+                # Set subtitle information without echoing it back through the
+                # change signals
+                item.label.setText(label)
+                with QSignalBlocker(item.speaker), QSignalBlocker(item.content):
+                    item.speaker.setText(subtitle.speaker)
+                    item.content.setPlainText(subtitle.text)
+                
+                # Make content editable
+                item.content.setReadOnly(False)
+                
+                # Connect speaker and content changes to the shared slots, only
+                # once the fields are populated
+                self._speaker_widgets[item.speaker] = idx
+                self._content_widgets[item.content] = idx
+                item.speaker.editingFinished.connect(self._on_speaker_edited)
+                item.content.editingFinished.connect(self._on_content_edited)
+                
+                # Set up tab order - speaker -> content -> next speaker
+                if previous_content_widget is not None:
+                    self.setTabOrder(previous_content_widget, item.speaker)
+                if previous_speaker_widget is not None:
+                    self.setTabOrder(item.speaker, item.content)
+                
+                previous_speaker_widget = item.speaker
+                previous_content_widget = item.content
+                
+                # Add to layout and track widget
+                self.timelineLayout.layout().addWidget(item)
+                self.timeline_widgets.append(item)
+        finally:
+            contents.setUpdatesEnabled(True)
+        
+        logger.debug(f"Built timeline objects {start} to {end - 1}")
+    
+    @staticmethod
+    def _timeline_labels(subtitles: List[Subtitle]) -> List[str]:
+        """
+        Build the timing labels shown on the subtitles' timeline objects.
         
-        logger.info(f"Displayed {len(subtitles)} subtitle timeline objects with proper tab order")
+        Args:
+            subtitles: Subtitles to describe
+            
+        Returns:
+            Label text with the formatted start and end times, per subtitle
+        """
+        start_times = SubtitleProcessor.format_times(s.start for s in subtitles)
+        end_times = SubtitleProcessor.format_times(s.stop for s in subtitles)
+        return [
+            f"Start: {start_time}, End: {end_time}"
+            for start_time, end_time in zip(start_times, end_times)
+        ]
 
+    def _queue_offset(self, offset: int) -> None:
+        """
+        Remember the latest offset and restart the debounce timer.
+        
+        Args:
+            offset: Offset in frames from the spin box
+        """
+        self._pending_offset = offset
+        self._offset_timer.start()
+    
+    def _apply_pending_offset(self) -> None:
+        """Apply the last offset queued by the spin box."""
+        self.offset_beginning(self._pending_offset)
+    
     def offset_beginning(self, offset: int) -> None:
         """
         Offset all subtitles by the specified amount.
@@ -231,11 +472,20 @@ class MainWindow(QMainWindow):
         # Calculate the difference from the previous offset
         offset_delta = offset - self.current_offset
         self.current_offset = offset
-        
+
+        # Nothing to do when the offset ends up where it started (e.g. the
+        # reset on load, or a burst of steps that returned to the old value)
+        if not offset_delta:
+            return
+
         # Apply only the delta to preserve user modifications
         SubtitleProcessor.apply_offset(self.subtitles, offset_delta)
         
-        self.display_subtitles(self.subtitles)
+        # Only the times changed, so update the existing labels in place
+        labels = self._timeline_labels(self.subtitles[:len(self.timeline_widgets)])
+        for widget, label in zip(self.timeline_widgets, labels):
+            widget.label.setText(label)
+        
         logger.info(f"Applied offset delta of {offset_delta} frames (total offset: {offset})")
     
     def update_max_words_per_line(self, max_words: int) -> None:
@@ -248,6 +498,16 @@ class MainWindow(QMainWindow):
         self.processor.max_words_per_line = max_words
         logger.info(f"Updated max_words_per_line to {max_words}")
     
+    def _on_speaker_edited(self) -> None:
+        """Apply an edit from the timeline speaker field that sent it."""
+        widget = self.sender()
+        self.change_speaker(self._speaker_widgets[widget], widget.text())
+    
+    def _on_content_edited(self) -> None:
+        """Apply an edit from the timeline content field that sent it."""
+        widget = self.sender()
+        self.change_content(self._content_widgets[widget], widget.toPlainText())
+    
     def change_speaker(self, index: int, new_speaker: str) -> None:
         """
         Update the speaker for a specific subtitle.
@@ -257,9 +517,16 @@ class MainWindow(QMainWindow):
             new_speaker: New speaker name
         """
         if 0 <= index < len(self.subtitles):
-            old_speaker = self.subtitles[index]['speaker']
-            self.subtitles[index]['speaker'] = new_speaker
-            self.populate_speaker_combo()
+            old_speaker = self.subtitles[index].speaker
+            if new_speaker == old_speaker:
+                return
+            
+            self.subtitles[index].speaker = new_speaker
+            
+            # Move the subtitle between speakers instead of rebuilding the
+            # whole index and combo box for a single edit
+            self._remove_from_speaker(old_speaker, index)
+            self._add_to_speaker(new_speaker, index)
             logger.debug(f"Changed speaker at index {index} from '{old_speaker}' to '{new_speaker}'")
         else:
             logger.warning(f"Invalid subtitle index: {index}")
@@ -273,7 +540,7 @@ class MainWindow(QMainWindow):
             new_content: New subtitle text
         """
         if 0 <= index < len(self.subtitles):
-            self.subtitles[index]['text'] = new_content
+            self.subtitles[index].text = new_content
             logger.debug(f"Changed content at index {index}")
         else:
             logger.warning(f"Invalid subtitle index: {index}")
@@ -288,17 +555,64 @@ class MainWindow(QMainWindow):
         if not self.subtitles:
             return
         
-        # Get unique speakers (including combined speakers)
-        unique_speakers = set(subtitle['speaker'] for subtitle in self.subtitles)
+        # Index subtitles by speaker (including combined speakers) so mass
+        # replace only visits the matching subtitles
+        self._speaker_index = {}
+        for idx, subtitle in enumerate(self.subtitles):
+            self._speaker_index.setdefault(subtitle.speaker, []).append(idx)
         
         # Sort speakers alphabetically
-        sorted_speakers = sorted(unique_speakers)
+        self._sorted_speakers = sorted(self._speaker_index)
         
         # Clear and populate combo box
         self.massComboSpeaker.clear()
-        self.massComboSpeaker.addItems(sorted_speakers)
+        self.massComboSpeaker.addItems(self._sorted_speakers)
+        
+        logger.debug(f"Populated speaker combo with {len(self._sorted_speakers)} unique speakers")
+    
+    def _remove_from_speaker(self, speaker: str, index: int) -> None:
+        """
+        Remove a subtitle from a speaker's index entry.
+        
+        The speaker is dropped from the combo box once no subtitle uses it.
+        
+        Args:
+            speaker: Speaker the subtitle no longer has
+            index: Index of the subtitle
+        """
+        indices = self._speaker_index.get(speaker)
+        if not indices:
+            return
+        
+        pos = bisect_left(indices, index)
+        if pos < len(indices) and indices[pos] == index:
+            del indices[pos]
         
-        logger.debug(f"Populated speaker combo with {len(sorted_speakers)} unique speakers")
+        if not indices:
+            del self._speaker_index[speaker]
+            pos = bisect_left(self._sorted_speakers, speaker)
+            del self._sorted_speakers[pos]
+            self.massComboSpeaker.removeItem(pos)
+    
+    def _add_to_speaker(self, speaker: str, index: int) -> None:
+        """
+        Add a subtitle to a speaker's index entry.
+        
+        A new speaker is inserted into the combo box at its sorted position.
+        
+        Args:
+            speaker: Speaker the subtitle now has
+            index: Index of the subtitle
+        """
+        indices = self._speaker_index.get(speaker)
+        if indices is not None:
+            insort(indices, index)
+            return
+        
+        self._speaker_index[speaker] = [index]
+        pos = bisect_left(self._sorted_speakers, speaker)
+        self._sorted_speakers.insert(pos, speaker)
+        self.massComboSpeaker.insertItem(pos, speaker)
     
     def mass_replace_speaker(self) -> None:
         """
@@ -337,15 +651,18 @@ class MainWindow(QMainWindow):
             logger.warning("Mass replace attempted with empty replacement text")
             return
         
-        # Count and replace
-        replace_count = 0
-        for subtitle in self.subtitles:
-            if subtitle['speaker'] == selected_speaker:
-                subtitle['speaker'] = replacement_text
-                replace_count += 1
+        # Count and replace, updating the matching speaker fields in place
+        matches = self._speaker_index.get(selected_speaker, ())
+        for idx in matches:
+            self.subtitles[idx].speaker = replacement_text
+            
+            if idx < len(self.timeline_widgets):
+                speaker_widget = self.timeline_widgets[idx].speaker
+                with QSignalBlocker(speaker_widget):
+                    speaker_widget.setText(replacement_text)
+        replace_count = len(matches)
         
-        # Update the display and combo box
-        self.display_subtitles(self.subtitles)
+        # Update the combo box
         self.populate_speaker_combo()
         
         # Clear the replacement field
@@ -359,6 +676,17 @@ class MainWindow(QMainWindow):
         )
         logger.info(f"Mass replaced {replace_count} occurrences of '{selected_speaker}' with '{replacement_text}'")
     
+    def _commit_focused_content(self) -> None:
+        """
+        Store an edit still in progress in the focused content editor.
+        
+        Content edits are committed when the editor loses focus, which
+        clicking a button does not guarantee on every platform.
+        """
+        widget = QApplication.focusWidget()
+        if isinstance(widget, ContentEdit):
+            widget.commit()
+    
     def mass_replace_text(self) -> None:
         """
         Replace all occurrences of a text string across all subtitle content.
@@ -366,6 +694,8 @@ class MainWindow(QMainWindow):
         Performs a case-sensitive substring replacement on every subtitle's text
         and shows a confirmation dialog with the number of subtitles modified.
         """
+        self._commit_focused_content()
+
         if not self.subtitles:
             QMessageBox.warning(
                 self,
@@ -388,12 +718,16 @@ class MainWindow(QMainWindow):
         replace_text = self.textReplaceInput.text()
 
         replace_count = 0
-        for subtitle in self.subtitles:
-            if find_text in subtitle['text']:
-                subtitle['text'] = subtitle['text'].replace(find_text, replace_text)
+        for idx, subtitle in enumerate(self.subtitles):
+            if find_text in subtitle.text:
+                subtitle.text = subtitle.text.replace(find_text, replace_text)
                 replace_count += 1
 
-        self.display_subtitles(self.subtitles)
+                # Update the matching content field in place
+                if idx < len(self.timeline_widgets):
+                    content_widget = self.timeline_widgets[idx].content
+                    with QSignalBlocker(content_widget):
+                        content_widget.setPlainText(subtitle.text)
 
         self.textFindInput.clear()
         self.textReplaceInput.clear()
@@ -421,6 +755,14 @@ class MainWindow(QMainWindow):
             logger.warning("Attempted to save with no subtitles loaded")
             return
         
+        # Apply an offset change that is still waiting on the debounce timer
+        if self._offset_timer.isActive():
+            self._offset_timer.stop()
+            self._apply_pending_offset()
+        
+        # Store an edit still in progress in the focused content editor
+        self._commit_focused_content()
+        
         file_dialog = QFileDialog(self)
         save_path, _ = file_dialog.getSaveFileName(
             self, 
@@ -439,14 +781,10 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                for idx, subtitle in enumerate(self.subtitles, start=1):
-                    start_time = SubtitleProcessor.format_time(subtitle['start'])
-                    end_time = SubtitleProcessor.format_time(subtitle['stop'])
-                    
-                    f.write(f"{idx}\n")
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{subtitle['speaker']}: {subtitle['text']}\n\n")
+            # Stream entries into the buffered file instead of building the
+            # whole SRT text in memory first
+            with open(save_path, 'w', encoding='utf-8', buffering=SubtitleProcessor.WRITE_BUFFER_SIZE) as f:
+                f.writelines(SubtitleProcessor.srt_entries(self.subtitles))
             
             QMessageBox.information(
                 self, 
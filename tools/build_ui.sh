@@ -0,0 +1,10 @@
+#!/usr/bin/env bash
+# Precompile the Qt Designer forms into Python modules with pyuic6.
+#
+# The GUI imports the generated modules when they exist and falls back to
+# compiling the .ui files at runtime otherwise. Re-run after editing a form.
+set -euo pipefail
+
+cd "$(dirname "$0")/.."
+
+pyuic6 ui/main_window.ui -o modules/_ui_main_window.py